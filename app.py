@@ -1,10 +1,13 @@
 import gradio as gr
 import pandas as pd
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, timedelta
 
 # Project modules
 from data_fetcher import fetch_equity_data, validate_dates
-from returns_calculator import calculate_daily_total_return, get_summary_statistics
+from returns_calculator import calculate_daily_total_return, get_summary_statistics, prepare_views
 from visualizations import (
     plot_cumulative_return,
     plot_periodic_returns,
@@ -12,66 +15,110 @@ from visualizations import (
     plot_daily_returns_boxplot,
     plot_dividend_timeline
 )
-from utils import format_summary_for_display, save_df_to_temp_csv
+from utils import format_summary_for_display, save_df_to_temp_parquet, convert_parquet_to_csv
+
+# Shared pool for building the independent plots and the CSV export in
+# parallel once the returns calculation has finished.
+_executor = ThreadPoolExecutor(max_workers=6)
+
+def _export_analysis_csv(df, filename):
+    """
+    Pool worker for the download file: writes the parquet export and
+    materializes its CSV, both memoized, and returns the CSV path.
+    """
+    return convert_parquet_to_csv(save_df_to_temp_parquet(df, filename))
+
+# Tickers warmed into the fetch cache at startup so the first analysis for
+# common symbols skips the Yahoo Finance round-trip.
+PREFETCH_WATCHLIST = ['AAPL', 'MSFT', '^GSPC', 'SPY']
+
+def _prewarm_cache(tickers):
+    """
+    Pre-fetches the default one-year range for a watchlist of tickers.
+
+    Runs on a daemon thread at startup; uses the same date strings as the
+    UI defaults so interactive analyses hit the on-disk fetch cache.
+    """
+    end = date.today().strftime("%Y-%m-%d")
+    start = (date.today() - timedelta(days=365)).strftime("%Y-%m-%d")
+    for ticker in tickers:
+        try:
+            fetch_equity_data(ticker, start, end)
+        except Exception as e:
+            print(f"Prefetch failed for {ticker}: {e}")
 
 # --- Analysis Function ---
-def analyze_equity(ticker, start_date, end_date, boxplot_period, progress=gr.Progress()):
+def analyze_equity(ticker, start_date, end_date, boxplot_period, progress=gr.Progress()) -> Iterator[list]:
     """
     Main function to run the analysis and generate outputs for the Gradio interface.
+
+    Implemented as a generator: the summary table is yielded as soon as the
+    returns are calculated, then each chart (and the download file) streams
+    in as its worker finishes, instead of blocking until everything is done.
     """
     # 1. Validate Inputs
     progress(0, desc="Validating inputs...")
     if not all([ticker, start_date, end_date]):
-        return [gr.Markdown("Error: Ticker, Begin Date, and End Date are required.")] + [gr.update(visible=False)] * 8
+        yield [gr.Markdown("Error: Ticker, Begin Date, and End Date are required.")] + [gr.update(visible=False)] * 8
+        return
 
     valid, msg = validate_dates(start_date, end_date)
     if not valid:
-        return [gr.Markdown(f"Error: {msg}")] + [gr.update(visible=False)] * 8
+        yield [gr.Markdown(f"Error: {msg}")] + [gr.update(visible=False)] * 8
+        return
 
     # 2. Fetch Data
     progress(0.2, desc=f"Fetching data for {ticker}...")
     try:
         data = fetch_equity_data(ticker, start_date, end_date)
         if data.empty:
-            return [gr.Markdown(f"Error: Could not fetch data for '{ticker}'. Check the symbol or date range.")] + [gr.update(visible=False)] * 8
+            yield [gr.Markdown(f"Error: Could not fetch data for '{ticker}'. Check the symbol or date range.")] + [gr.update(visible=False)] * 8
+            return
     except Exception as e:
-        return [gr.Markdown(f"An unexpected error occurred: {e}")] + [gr.update(visible=False)] * 8
+        yield [gr.Markdown(f"An unexpected error occurred: {e}")] + [gr.update(visible=False)] * 8
+        return
 
     # 3. Calculate Returns
     progress(0.4, desc="Calculating returns...")
     data_with_returns = calculate_daily_total_return(data)
-    daily_total_returns = data_with_returns['Total_Return'].dropna()
+    views = prepare_views(data_with_returns)
+    daily_total_returns = views['daily_total_returns']
 
-    # 4. Generate Summary Statistics
+    # 4. Generate Summary Statistics and push them to the UI immediately
     progress(0.5, desc="Generating summary...")
-    summary_stats = get_summary_statistics(data_with_returns)
+    summary_stats = get_summary_statistics(data_with_returns, dividends=views['dividends'])
     summary_df = format_summary_for_display(summary_stats)
 
-    # 5. Generate Visualizations
-    progress(0.6, desc="Creating charts...")
-    fig_cumulative = plot_cumulative_return(data_with_returns.copy())
-    fig_periodic = plot_periodic_returns(daily_total_returns.copy())
-    fig_volume = plot_volume_analysis(data.copy())
-    fig_boxplot = plot_daily_returns_boxplot(daily_total_returns.copy(), boxplot_period)
-    fig_dividends = plot_dividend_timeline(data.copy())
-    
-    # 6. Prepare Data Table for Download
-    progress(0.9, desc="Finalizing...")
-    download_filename = f"{ticker}_analysis_{start_date}_to_{end_date}.csv"
-    csv_path = save_df_to_temp_csv(data_with_returns, download_filename)
-
-    return [
+    yield [
         gr.update(visible=False), # Hide error message
         gr.update(visible=True, value=summary_df),
-        gr.update(visible=True, value=fig_cumulative),
-        gr.update(visible=True, value=fig_periodic),
-        gr.update(visible=True, value=fig_volume),
-        gr.update(visible=True, value=fig_boxplot),
-        gr.update(visible=True, value=fig_dividends),
+        gr.update(), gr.update(), gr.update(), gr.update(), gr.update(),
         gr.update(visible=True, value=data_with_returns.reset_index()),
-        gr.update(visible=True, value=csv_path)
+        gr.update(),
     ]
 
+    # 5. Generate Visualizations and the download file concurrently,
+    # streaming each one to its output slot as soon as it is ready.
+    # The plot functions only read from their inputs, so no defensive copies.
+    progress(0.6, desc="Creating charts...")
+    download_filename = f"{ticker}_analysis_{start_date}_to_{end_date}.parquet"
+    output_slots = {
+        _executor.submit(plot_cumulative_return, data_with_returns): 2,
+        _executor.submit(plot_periodic_returns, views): 3,
+        _executor.submit(plot_volume_analysis, data): 4,
+        _executor.submit(plot_daily_returns_boxplot, daily_total_returns, boxplot_period): 5,
+        _executor.submit(plot_dividend_timeline, views): 6,
+        _executor.submit(_export_analysis_csv, data_with_returns, download_filename): 8,
+    }
+
+    done = 0
+    for future in as_completed(output_slots):
+        done += 1
+        progress(0.6 + 0.4 * done / len(output_slots), desc="Creating charts...")
+        updates = [gr.update()] * 9
+        updates[output_slots[future]] = gr.update(visible=True, value=future.result())
+        yield updates
+
 # --- Gradio Interface ---
 def build_ui():
     """
@@ -130,7 +177,7 @@ def build_ui():
         # --- Event Handlers ---
         all_inputs = [ticker_input, start_date_input, end_date_input, boxplot_period_input]
         all_outputs = [
-            error_output, summary_output, cumulative_plot, periodic_plot, 
+            error_output, summary_output, cumulative_plot, periodic_plot,
             volume_plot, boxplot_plot, dividend_plot, data_table_output, download_button
         ]
 
@@ -174,5 +221,8 @@ if __name__ == "__main__":
             if os.path.exists(f"equity_analyzer/{f}"):
                 shutil.move(f"equity_analyzer/{f}", f)
 
+    # Warm the fetch cache for popular tickers off the interactive path
+    threading.Thread(target=_prewarm_cache, args=(PREFETCH_WATCHLIST,), daemon=True).start()
+
     app = build_ui()
     app.launch(debug=True)
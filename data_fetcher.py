@@ -1,11 +1,101 @@
+import pickle
+import sqlite3
+import time
+
 import yfinance as yf
 import pandas as pd
-from datetime import datetime
+from curl_cffi import requests as curl_requests
+from datetime import date, datetime, timedelta
+
+# Shared HTTP session so repeat fetches reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per call. yfinance requires a
+# curl_cffi session (it rejects plain requests.Session objects).
+_session = curl_requests.Session(impersonate="chrome")
+
+# On-disk memoization of yfinance fetches. Repeat queries for the same
+# (ticker, start_date, end_date) are served from local storage instead of
+# hitting Yahoo Finance again.
+CACHE_DB_PATH = "cache.sqlite"
+CACHE_TTL_SECONDS = 3600  # Refresh window for ranges that include today
+
+_cache_stats = {'hits': 0, 'misses': 0}
+
+def _cache_connection() -> sqlite3.Connection:
+    """
+    Opens the cache database, creating the table on first use.
+    """
+    conn = sqlite3.connect(CACHE_DB_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS fetch_cache ("
+        "ticker TEXT, start_date TEXT, end_date TEXT, "
+        "pickled_df BLOB, fetched_at REAL, "
+        "PRIMARY KEY (ticker, start_date, end_date))"
+    )
+    return conn
+
+def _load_cached_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame | None:
+    """
+    Returns the cached DataFrame for the given query, or None on a miss.
+
+    Entries whose range extended to the day they were fetched (and may
+    therefore hold a partial final bar) are considered stale after
+    CACHE_TTL_SECONDS so the data gets refreshed.
+    """
+    try:
+        with _cache_connection() as conn:
+            row = conn.execute(
+                "SELECT pickled_df, fetched_at FROM fetch_cache "
+                "WHERE ticker = ? AND start_date = ? AND end_date = ?",
+                (ticker, start_date, end_date)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        pickled_df, fetched_at = row
+        # Partial when stored: the range reached the day of the fetch itself,
+        # so the final bar may have been mid-session. Judged against the
+        # fetch date, not today, or such entries would turn permanent once
+        # the calendar moved on.
+        fetched_on = datetime.fromtimestamp(fetched_at).date().isoformat()
+        was_partial = end_date >= fetched_on
+        if was_partial and (time.time() - fetched_at) > CACHE_TTL_SECONDS:
+            return None
+
+        return pickle.loads(pickled_df)
+
+    except Exception as e:
+        print(f"Cache lookup failed for {ticker}: {e}")
+        return None
+
+def _store_cached_data(ticker: str, start_date: str, end_date: str, data: pd.DataFrame) -> None:
+    """
+    Stores a fetched DataFrame in the cache, replacing any stale entry.
+    """
+    try:
+        with _cache_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO fetch_cache "
+                "(ticker, start_date, end_date, pickled_df, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (ticker, start_date, end_date, pickle.dumps(data), time.time())
+            )
+    except Exception as e:
+        print(f"Cache store failed for {ticker}: {e}")
+
+def get_cache_stats() -> dict:
+    """
+    Returns hit/miss counters for the fetch cache (observability helper).
+    """
+    return dict(_cache_stats)
 
 def fetch_equity_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
     """
     Fetches historical equity data from Yahoo Finance.
 
+    Results are memoized on disk keyed on (ticker, start_date, end_date),
+    so repeat queries return from the local cache instead of the network.
+
     Args:
         ticker (str): The stock ticker symbol.
         start_date (str): The start date for the data (YYYY-MM-DD).
@@ -15,23 +105,45 @@ def fetch_equity_data(ticker: str, start_date: str, end_date: str) -> pd.DataFra
         pd.DataFrame: A DataFrame containing the historical data, or an empty
                       DataFrame if an error occurs.
     """
+    cached = _load_cached_data(ticker, start_date, end_date)
+    if cached is not None:
+        _cache_stats['hits'] += 1
+        return cached
+    _cache_stats['misses'] += 1
+
     try:
-        stock = yf.Ticker(ticker)
-        # Add 1 day to end_date to make it inclusive in yfinance
-        end_date_inclusive = (pd.to_datetime(end_date) + pd.Timedelta(days=1)).strftime('%Y-%m-%d')
+        stock = yf.Ticker(ticker, session=_session)
+        # Add 1 day to end_date to make it inclusive in yfinance. Validation
+        # already guarantees YYYY-MM-DD, so the C-level ISO parser suffices
+        # instead of pandas' format-inference machinery.
+        end_date_inclusive = (date.fromisoformat(end_date) + timedelta(days=1)).isoformat()
         data = stock.history(start=start_date, end=end_date_inclusive, auto_adjust=False)
 
         if data.empty:
             raise ValueError(f"No data found for ticker '{ticker}' in the given date range.")
 
         # Ensure required columns are present
-        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume', 'Dividends', 'Stock Splits']
+        required_cols = ['Close', 'Volume', 'Dividends']
         for col in required_cols:
             if col not in data.columns:
                 data[col] = 0
 
-        # Forward fill dividends and stock splits to align with price data on ex-dividend dates
-        data[['Dividends', 'Stock Splits']] = data[['Dividends', 'Stock Splits']].fillna(0)
+        # Forward fill dividends to align with price data on ex-dividend dates
+        data['Dividends'] = data['Dividends'].fillna(0)
+
+        # Downstream code only reads Close, Dividends and Volume; dropping
+        # the other yfinance columns shrinks every subsequent pass (and the
+        # cached payload) accordingly.
+        data = data[required_cols].copy()
+
+        # Narrow the price columns: float32 precision is ample for prices
+        # and halves the bytes every downstream pass has to move. Volume
+        # stays int64 — daily volumes above ~16.7M shares would be rounded
+        # by float32's 24-bit mantissa, and it never enters the return
+        # kernels anyway.
+        data = data.astype({'Close': 'float32', 'Dividends': 'float32'})
+
+        _store_cached_data(ticker, start_date, end_date, data)
 
         return data
 
@@ -52,8 +164,10 @@ def validate_dates(start_date_str: str, end_date_str: str) -> tuple[bool, str]:
                           and a string message.
     """
     try:
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-        end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
+        # C-implemented ISO parser; much cheaper than strptime for the
+        # fixed YYYY-MM-DD format used throughout the app
+        start_date = date.fromisoformat(start_date_str)
+        end_date = date.fromisoformat(end_date_str)
         today = datetime.now().date()
 
         if start_date > end_date:
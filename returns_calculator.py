@@ -9,25 +9,92 @@ def calculate_daily_total_return(data: pd.DataFrame) -> pd.DataFrame:
         data (pd.DataFrame): DataFrame with 'Close', 'Dividends' columns.
 
     Returns:
-        pd.DataFrame: Original DataFrame with 'Price_Return' and 'Total_Return' columns.
+        pd.DataFrame: Original DataFrame with 'Price_Return', 'Total_Return',
+                      'Cumulative_Price_Return' and 'Cumulative_Total_Return'
+                      columns.
     """
-    data['Price_Return'] = data['Close'].pct_change()
-    data['Dividend_Yield'] = data['Dividends'] / data['Close'].shift(1)
-    data['Total_Return'] = data['Price_Return'] + data['Dividend_Yield'].fillna(0)
+    # Single vectorized pass over the raw NumPy buffers instead of three
+    # separate pandas column ops (pct_change, shift+divide, add). The
+    # cumulative series are produced here too, while the return arrays are
+    # still hot, so plotting does not recompute them.
+    close = data['Close'].to_numpy()
+    dividends = data['Dividends'].to_numpy()
+    prev_close = close[:-1]
+    price_return = (close[1:] - prev_close) / prev_close
+    total_return = price_return + dividends[1:] / prev_close
+
+    data['Price_Return'] = np.concatenate(([np.nan], price_return))
+    data['Total_Return'] = np.concatenate(([np.nan], total_return))
+    data['Cumulative_Price_Return'] = np.concatenate(([np.nan], np.cumprod(1 + price_return) - 1))
+    data['Cumulative_Total_Return'] = np.concatenate(([np.nan], np.cumprod(1 + total_return) - 1))
     return data
 
-def calculate_aggregated_returns(daily_returns: pd.Series, period: str) -> pd.Series:
+def calculate_log_returns(daily_returns: pd.Series) -> pd.Series:
+    """
+    Converts daily simple returns to log returns.
+
+    Computing this once lets several aggregations share the same buffer,
+    since compounding becomes a plain resample-sum over log returns.
+
+    Args:
+        daily_returns (pd.Series): A Series of daily total returns.
+
+    Returns:
+        pd.Series: A Series of daily log returns with the same index.
+    """
+    return pd.Series(np.log1p(daily_returns.to_numpy()), index=daily_returns.index)
+
+def calculate_aggregated_returns(daily_returns: pd.Series, period: str,
+                                 log_returns: pd.Series | None = None) -> pd.Series:
     """
     Calculates aggregated (compounded) returns for a given period.
 
     Args:
         daily_returns (pd.Series): A Series of daily total returns.
         period (str): 'ME' for monthly, 'QE' for quarterly, 'YE' for yearly.
+        log_returns (pd.Series | None): Optional precomputed log returns
+            (see calculate_log_returns) to reuse across multiple periods.
 
     Returns:
         pd.Series: A Series of aggregated returns for the specified period.
     """
-    return daily_returns.resample(period).apply(lambda x: (1 + x).prod() - 1)
+    if log_returns is None:
+        log_returns = calculate_log_returns(daily_returns)
+    # Compounding (1+x).prod()-1 equals expm1(sum(log1p(x))), but the sum is
+    # a C-level resample reduction instead of a Python apply per group.
+    return np.expm1(log_returns.resample(period).sum())
+
+def _metrics_kernel(returns: np.ndarray) -> tuple[float, float, float, float, float]:
+    """
+    Computes the raw reductions behind the performance metrics in a single
+    sweep over one NumPy array: total return, mean, standard deviation,
+    maximum drawdown and geometric mean.
+
+    Compounding is done in the log domain (log1p/cumsum/expm1): sums of logs
+    accumulate far less floating-point error than a cumprod over thousands
+    of daily factors, and the cumulative-log buffer is shared by the total
+    return, drawdown and geometric mean.
+
+    Args:
+        returns (np.ndarray): Array of daily total returns (no NaNs).
+
+    Returns:
+        tuple: (total_return, mean, std, max_drawdown, geometric_mean).
+    """
+    # Accumulate in float64 even when the inputs are narrowed to float32:
+    # compounding thousands of daily returns loses precision at 24 bits.
+    returns = np.asarray(returns, dtype=np.float64)
+    logs = np.log1p(returns)
+    log_cumulative = np.cumsum(logs)
+    total_return = np.expm1(log_cumulative[-1])
+    # Drawdown relative to the running peak: log is monotone, so the peak of
+    # the cumulative return is the running max of the cumulative log.
+    log_peak = np.maximum.accumulate(log_cumulative)
+    max_drawdown = np.min(np.expm1(log_cumulative - log_peak))
+    mean = returns.mean()
+    std = returns.std(ddof=1)
+    geometric_mean = np.expm1(logs.mean())
+    return total_return, mean, std, max_drawdown, geometric_mean
 
 def calculate_performance_metrics(daily_returns: pd.Series, risk_free_rate: float = 0.0) -> dict:
     """
@@ -51,31 +118,23 @@ def calculate_performance_metrics(daily_returns: pd.Series, risk_free_rate: floa
             'geometric_mean_return': 0,
         }
 
-    # Total Return
-    total_return = (1 + daily_returns).prod() - 1
+    # All O(N) reductions happen in one kernel over the raw array instead of
+    # six separate pandas passes.
+    returns = daily_returns.to_numpy()
+    (total_return, arithmetic_mean_return, daily_std,
+     max_drawdown, geometric_mean_return) = _metrics_kernel(returns)
 
     # Compound Annual Growth Rate (CAGR)
-    num_days = len(daily_returns)
+    num_days = len(returns)
     num_years = num_days / 252  # Assuming 252 trading days in a year
     cagr = ((1 + total_return)**(1 / num_years) - 1) if num_years > 0 else 0
 
     # Annualized Volatility
-    annualized_volatility = daily_returns.std() * np.sqrt(252)
-
-    # Sharpe Ratio
-    excess_returns = daily_returns - (risk_free_rate / 252)
-    sharpe_ratio = (excess_returns.mean() / excess_returns.std()) * np.sqrt(252) if excess_returns.std() != 0 else 0
-
-    # Maximum Drawdown
-    cumulative_returns = (1 + daily_returns).cumprod()
-    peak = cumulative_returns.expanding(min_periods=1).max()
-    drawdown = (cumulative_returns - peak) / peak
-    max_drawdown = drawdown.min()
-
-    # Mean Returns
-    arithmetic_mean_return = daily_returns.mean()
-    geometric_mean_return = (1 + daily_returns).prod()**(1/len(daily_returns)) - 1 if len(daily_returns) > 0 else 0
+    annualized_volatility = daily_std * np.sqrt(252)
 
+    # Sharpe Ratio (subtracting a constant rate leaves the std unchanged)
+    excess_mean = arithmetic_mean_return - (risk_free_rate / 252)
+    sharpe_ratio = (excess_mean / daily_std) * np.sqrt(252) if daily_std != 0 else 0
 
     return {
         'total_return': total_return,
@@ -87,13 +146,43 @@ def calculate_performance_metrics(daily_returns: pd.Series, risk_free_rate: floa
         'geometric_mean_return': geometric_mean_return,
     }
 
-def get_summary_statistics(data_with_returns: pd.DataFrame, risk_free_rate: float = 0.0) -> dict:
+def prepare_views(data_with_returns: pd.DataFrame) -> dict:
+    """
+    Precomputes the derived views shared by the plotting functions, so each
+    series is scanned once per analysis instead of once per plot.
+
+    Args:
+        data_with_returns (pd.DataFrame): DataFrame with 'Total_Return' and
+            'Dividends' columns (see calculate_daily_total_return).
+
+    Returns:
+        dict: Precomputed views with keys 'daily_total_returns' (clean daily
+              Series), 'monthly'/'quarterly'/'yearly' (aggregated returns)
+              and 'dividends' (rows with a dividend payment).
+    """
+    daily_total_returns = data_with_returns['Total_Return'].dropna()
+    log_returns = calculate_log_returns(daily_total_returns)
+    # One scan of the Dividends column serves both the dividend timeline
+    # and the summary statistics
+    dividend_idx = np.flatnonzero(data_with_returns['Dividends'].to_numpy() > 0)
+    return {
+        'daily_total_returns': daily_total_returns,
+        'monthly': calculate_aggregated_returns(daily_total_returns, 'ME', log_returns),
+        'quarterly': calculate_aggregated_returns(daily_total_returns, 'QE', log_returns),
+        'yearly': calculate_aggregated_returns(daily_total_returns, 'YE', log_returns),
+        'dividends': data_with_returns.iloc[dividend_idx],
+    }
+
+def get_summary_statistics(data_with_returns: pd.DataFrame, risk_free_rate: float = 0.0,
+                           dividends: pd.DataFrame | None = None) -> dict:
     """
     Generates a summary statistics table.
 
     Args:
         data_with_returns (pd.DataFrame): DataFrame with 'Total_Return' and 'Dividends' columns.
         risk_free_rate (float): The annual risk-free rate.
+        dividends (pd.DataFrame | None): Optional precomputed dividends-only
+            subframe (see prepare_views) to avoid rescanning the column.
 
     Returns:
         dict: A dictionary of summary statistics.
@@ -101,13 +190,16 @@ def get_summary_statistics(data_with_returns: pd.DataFrame, risk_free_rate: floa
     daily_returns = data_with_returns['Total_Return'].dropna()
     metrics = calculate_performance_metrics(daily_returns, risk_free_rate)
 
+    if dividends is None:
+        dividends = data_with_returns[data_with_returns['Dividends'] > 0]
+
     summary = {
         "Total Return (%)": f"{metrics['total_return'] * 100:.2f}",
         "Annualized Return (CAGR) (%)": f"{metrics['cagr'] * 100:.2f}",
         "Annualized Volatility (%)": f"{metrics['annualized_volatility'] * 100:.2f}",
         "Sharpe Ratio": f"{metrics['sharpe_ratio']:.2f}",
         "Maximum Drawdown (%)": f"{metrics['max_drawdown'] * 100:.2f}",
-        "Number of Dividend Payments": data_with_returns[data_with_returns['Dividends'] > 0].shape[0],
-        "Total Dividends per Share": f"{data_with_returns['Dividends'].sum():.2f}",
+        "Number of Dividend Payments": dividends.shape[0],
+        "Total Dividends per Share": f"{dividends['Dividends'].sum():.2f}",
     }
     return summary
@@ -19,12 +19,48 @@ def format_summary_for_display(summary: dict) -> pd.DataFrame:
 import tempfile
 import os
 
-def save_df_to_temp_csv(df: pd.DataFrame, filename: str) -> str:
+# Signatures of already-written export files, so repeat analyses of the same
+# ticker/date range skip re-encoding entirely.
+_export_cache: dict[str, tuple] = {}
+
+def _df_signature(df: pd.DataFrame) -> tuple:
+    """
+    Builds a cheap identity for an export frame: shape, index endpoints and
+    the values of the last row. The last row makes the signature sensitive
+    to intraday refreshes, where a re-fetched range has the same shape and
+    endpoints but an updated final bar.
     """
-    Saves a DataFrame to a temporary CSV file with a specific name and returns the path.
+    if len(df.index) == 0:
+        return (df.shape, None, None, None)
+    return (df.shape, str(df.index[0]), str(df.index[-1]), tuple(df.iloc[-1]))
+
+def save_df_to_temp_parquet(df: pd.DataFrame, filename: str) -> str:
+    """
+    Saves a DataFrame to a temporary parquet file and returns the path.
+
+    Parquet is a fast binary write, so this is what the analysis pipeline
+    produces; the CSV a user downloads is materialized from it by
+    convert_parquet_to_csv. The write is memoized by frame signature.
     """
     temp_dir = tempfile.gettempdir()
     temp_path = os.path.join(temp_dir, filename)
-    df.to_csv(temp_path, index=True)
+
+    signature = _df_signature(df)
+    if _export_cache.get(temp_path) == signature and os.path.exists(temp_path):
+        return temp_path
+
+    df.to_parquet(temp_path, index=True)
+    _export_cache[temp_path] = signature
     return temp_path
 
+def convert_parquet_to_csv(parquet_path: str) -> str:
+    """
+    Materializes the CSV next to a previously written parquet export,
+    re-encoding only when the parquet is newer than the existing CSV.
+    """
+    csv_path = os.path.splitext(parquet_path)[0] + '.csv'
+    if (not os.path.exists(csv_path)
+            or os.path.getmtime(csv_path) < os.path.getmtime(parquet_path)):
+        pd.read_parquet(parquet_path).to_csv(csv_path, index=True)
+    return csv_path
+
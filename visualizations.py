@@ -1,17 +1,72 @@
+import functools
+
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import pandas as pd
 
-from returns_calculator import calculate_aggregated_returns
+# Figure skeletons built once at import time. Each plot function starts from
+# a copy of its skeleton and only fills in trace data, instead of re-running
+# the layout/template dict merges on every request.
+
+_CUMULATIVE_SKELETON = go.Figure(layout=go.Layout(
+    title='Cumulative Return Comparison',
+    xaxis_title='Date',
+    yaxis_title='Cumulative Return (%)',
+    legend_title='Return Type',
+    template='plotly_white'
+))
+
+def _make_periodic_skeleton() -> go.Figure:
+    fig = make_subplots(
+        rows=3, cols=1,
+        subplot_titles=('Monthly Returns', 'Quarterly Returns', 'Yearly Returns'),
+        vertical_spacing=0.1
+    )
+    fig.update_layout(
+        title_text='Periodic Returns',
+        height=800,
+        showlegend=False,
+        template='plotly_white'
+    )
+    fig.update_yaxes(title_text="Return (%)")
+    return fig
+
+_PERIODIC_SKELETON = _make_periodic_skeleton()
+
+def _make_volume_skeleton() -> go.Figure:
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.update_layout(
+        title_text='Price and Volume Analysis',
+        template='plotly_white'
+    )
+    fig.update_yaxes(title_text="Price", secondary_y=False)
+    fig.update_yaxes(title_text="Volume", secondary_y=True)
+    return fig
+
+_VOLUME_SKELETON = _make_volume_skeleton()
+
+_BOXPLOT_SKELETON = go.Figure(layout=go.Layout(
+    xaxis_title='Period',
+    yaxis_title='Daily Total Return (%)',
+    template='plotly_white',
+    showlegend=False
+))
+
+_DIVIDEND_SKELETON = go.Figure(layout=go.Layout(
+    title='Dividend Payment Timeline',
+    xaxis_title='Ex-Dividend Date',
+    yaxis_title='Dividend per Share ($)',
+    template='plotly_white'
+))
 
 def plot_cumulative_return(data: pd.DataFrame):
     """
     Plots the cumulative total return vs. price return.
-    """
-    data['Cumulative_Price_Return'] = (1 + data['Price_Return']).cumprod() - 1
-    data['Cumulative_Total_Return'] = (1 + data['Total_Return']).cumprod() - 1
 
-    fig = go.Figure()
+    Expects the cumulative columns computed by calculate_daily_total_return.
+    """
+    fig = go.Figure(_CUMULATIVE_SKELETON)
     fig.add_trace(go.Scatter(
         x=data.index, y=data['Cumulative_Price_Return'] * 100,
         mode='lines', name='Price Return Only'
@@ -20,126 +75,114 @@ def plot_cumulative_return(data: pd.DataFrame):
         x=data.index, y=data['Cumulative_Total_Return'] * 100,
         mode='lines', name='Total Return (with Dividends)'
     ))
-    fig.update_layout(
-        title='Cumulative Return Comparison',
-        xaxis_title='Date',
-        yaxis_title='Cumulative Return (%)',
-        legend_title='Return Type',
-        template='plotly_white'
-    )
     return fig
 
-def plot_periodic_returns(daily_total_returns: pd.Series):
+def plot_periodic_returns(views: dict):
     """
     Plots bar charts for monthly, quarterly, and yearly returns.
+
+    Args:
+        views (dict): Precomputed views from returns_calculator.prepare_views.
     """
-    monthly = calculate_aggregated_returns(daily_total_returns, 'ME') * 100
-    quarterly = calculate_aggregated_returns(daily_total_returns, 'QE') * 100
-    yearly = calculate_aggregated_returns(daily_total_returns, 'YE') * 100
+    monthly = views['monthly'] * 100
+    quarterly = views['quarterly'] * 100
+    yearly = views['yearly'] * 100
 
-    fig = make_subplots(
-        rows=3, cols=1,
-        subplot_titles=('Monthly Returns', 'Quarterly Returns', 'Yearly Returns'),
-        vertical_spacing=0.1
-    )
+    # Traces reference the skeleton's subplot axes explicitly, since the
+    # grid refs from make_subplots do not survive the go.Figure copy
+    fig = go.Figure(_PERIODIC_SKELETON)
 
     fig.add_trace(go.Bar(
         x=monthly.index, y=monthly, name='Monthly',
-        marker_color=['green' if v >= 0 else 'red' for v in monthly]
-    ), row=1, col=1)
+        marker_color=np.where(monthly.to_numpy() >= 0, 'green', 'red').tolist(),
+        xaxis='x', yaxis='y'
+    ))
 
     fig.add_trace(go.Bar(
         x=quarterly.index, y=quarterly, name='Quarterly',
-        marker_color=['green' if v >= 0 else 'red' for v in quarterly]
-    ), row=2, col=1)
+        marker_color=np.where(quarterly.to_numpy() >= 0, 'green', 'red').tolist(),
+        xaxis='x2', yaxis='y2'
+    ))
 
     fig.add_trace(go.Bar(
         x=yearly.index, y=yearly, name='Yearly',
-        marker_color=['green' if v >= 0 else 'red' for v in yearly]
-    ), row=3, col=1)
-
-    fig.update_layout(
-        title_text='Periodic Returns',
-        height=800,
-        showlegend=False,
-        template='plotly_white'
-    )
-    fig.update_yaxes(title_text="Return (%)")
+        marker_color=np.where(yearly.to_numpy() >= 0, 'green', 'red').tolist(),
+        xaxis='x3', yaxis='y3'
+    ))
     return fig
 
 def plot_volume_analysis(data: pd.DataFrame):
     """
     Plots a dual-axis chart with price and volume.
     """
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig = go.Figure(_VOLUME_SKELETON)
 
-    fig.add_trace(
-        go.Scatter(x=data.index, y=data['Close'], name="Price"),
-        secondary_y=False,
-    )
-    fig.add_trace(
-        go.Bar(x=data.index, y=data['Volume'], name="Volume"),
-        secondary_y=True,
-    )
-
-    fig.update_layout(
-        title_text='Price and Volume Analysis',
-        template='plotly_white'
-    )
-    fig.update_yaxes(title_text="Price", secondary_y=False)
-    fig.update_yaxes(title_text="Volume", secondary_y=True)
+    fig.add_trace(go.Scatter(x=data.index, y=data['Close'], name="Price", yaxis='y'))
+    fig.add_trace(go.Bar(x=data.index, y=data['Volume'], name="Volume", yaxis='y2'))
     return fig
 
+@functools.lru_cache(maxsize=32)
+def _to_period_cached(index_i8: tuple, unit: str, tz: str | None, freq: str) -> pd.PeriodIndex:
+    """
+    Memoized period-index conversion keyed on the raw epoch timestamps plus
+    their unit and timezone, so flipping the boxplot aggregation on the same
+    date range reuses the previous conversion instead of recomputing it.
+
+    The timezone matters: asi8 values are UTC, but periods must be bucketed
+    by exchange-local wall time or the first day of each period lands in the
+    previous bucket for UTC-ahead exchanges.
+    """
+    stamps = pd.DatetimeIndex(np.asarray(index_i8, dtype=f'datetime64[{unit}]'))
+    if tz is not None:
+        stamps = stamps.tz_localize('UTC').tz_convert(tz)
+    return stamps.to_period(freq)
+
 def plot_daily_returns_boxplot(daily_total_returns: pd.Series, period: str):
     """
     Creates a box plot of daily return distribution by a specified time period.
     """
     if period == 'Monthly':
-        grouper = daily_total_returns.index.to_period('M')
+        freq = 'M'
     elif period == 'Quarterly':
-        grouper = daily_total_returns.index.to_period('Q')
+        freq = 'Q'
     else: # Yearly
-        grouper = daily_total_returns.index.to_period('Y')
-
-    fig = go.Figure()
-    
-    # Group by the specified period and create a box for each group
-    for name, group in daily_total_returns.groupby(grouper):
-        fig.add_trace(go.Box(
-            y=group * 100,
-            name=str(name),
-            boxpoints='outliers' # Show outliers
-        ))
-
-    fig.update_layout(
-        title=f'Daily Total Return Distribution by {period}',
-        xaxis_title='Period',
-        yaxis_title='Daily Total Return (%)',
-        template='plotly_white',
-        showlegend=False
+        freq = 'Y'
+    index = daily_total_returns.index
+    grouper = _to_period_cached(
+        tuple(index.asi8), index.unit,
+        str(index.tz) if index.tz is not None else None, freq
     )
+
+    fig = go.Figure(_BOXPLOT_SKELETON)
+    fig.layout.title.text = f'Daily Total Return Distribution by {period}'
+
+    # A single trace with per-point category labels: Plotly groups the boxes
+    # client-side, so the payload is one array of length N instead of one
+    # serialized trace per period.
+    fig.add_trace(go.Box(
+        x=grouper.astype(str),
+        y=daily_total_returns.to_numpy() * 100,
+        boxpoints='outliers' # Show outliers
+    ))
     return fig
 
-def plot_dividend_timeline(data: pd.DataFrame):
+def plot_dividend_timeline(views: dict):
     """
     Plots a scatter/bar chart of dividend payments over time.
+
+    Args:
+        views (dict): Precomputed views from returns_calculator.prepare_views.
     """
-    dividends = data[data['Dividends'] > 0]
+    dividends = views['dividends']
     if dividends.empty:
         fig = go.Figure()
         fig.update_layout(title="No dividends were paid in this period.")
         return fig
 
-    fig = go.Figure()
+    fig = go.Figure(_DIVIDEND_SKELETON)
     fig.add_trace(go.Bar(
         x=dividends.index,
         y=dividends['Dividends'],
         name='Dividend Amount'
     ))
-    fig.update_layout(
-        title='Dividend Payment Timeline',
-        xaxis_title='Ex-Dividend Date',
-        yaxis_title='Dividend per Share ($)',
-        template='plotly_white'
-    )
     return fig